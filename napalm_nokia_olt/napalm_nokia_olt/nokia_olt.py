@@ -3,14 +3,23 @@
 
 from __future__ import print_function
 from __future__ import unicode_literals
+import itertools
+import queue
 import socket
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from netmiko import ConnectHandler
 from napalm.base.base import NetworkDriver
 from napalm.base.netmiko_helpers import netmiko_args
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 from collections import defaultdict
 
+try:
+    # releases the GIL while matching, helps when polling many OLTs from threads
+    import regex as re
+except ImportError:
+    import re
+
 
 PORT_REGEX = r"^(?!=|-|\s|Port|Id.).+$"
 REMOTE_HOST_REGEX = r"^System Name[\s:]+(.+)$"
@@ -20,11 +29,68 @@ REMOTE_PORT_DESCR_REGEX = r"^Port Description[:\s]+(.+)$"
 REMOTE_SYS_DESCR_REGEX = r"(?<=^System Description)\s*:\s(.*)(?=\n\n\n)"
 REMOTE_SYS_CAP_REGEX = r"^Supported Caps[\s:]+(.+)$"
 REMOTE_SYS_EN_CAP_REGEX = r"^Enabled Caps[\s:]+(.+)$"
+# first column of the "show port" lines whose last column is not "vport"
+NON_VPORT_PORT_REGEX = r"^(?!=|-|\s|Port|Id.)(?!.*(?<!\S)vport[ \t]*$)(\S+)"
+
+NON_VPORT_PORT_RE = re.compile(NON_VPORT_PORT_REGEX, re.MULTILINE)
+REMOTE_HOST_RE = re.compile(REMOTE_HOST_REGEX, re.MULTILINE)
+REMOTE_PORT_RE = re.compile(REMOTE_PORT_REGEX, re.MULTILINE)
+LEADING_BLANKS_RE = re.compile(r"\s*")
+
+# ASCII null byte written to keep the session alive, at most once per interval (seconds)
+SSH_KEEPALIVE = chr(0)
+SSH_KEEPALIVE_INTERVAL = 10
+
+# most commands written at once when pipelining, keeps per port batches (LLDP) small
+PIPELINE_MAX_COMMANDS = 8
+
+# interface attributes not implemented by the driver
+INTERFACE_DEFAULTS = {"mac_address": "0000.0000.0000", "last_flapped": -1.0, "mtu": 0}
+
+
+class _TextReader:
+    """File-like view of a command output, encoded chunk by chunk as the parser reads it"""
+
+    def __init__(self, text):
+        self._text = text
+        # the xml declaration must come first, skip leading blanks without copying
+        self._pos = LEADING_BLANKS_RE.match(text).end()
+
+    def read(self, size=-1):
+        if size < 0:
+            size = len(self._text) - self._pos
+        chunk = self._text[self._pos : self._pos + size]
+        self._pos += len(chunk)
+        return chunk.encode()
+
+
+def _port_key(port):
+    """Sort key for port indexes like "1/1/3/16/22" """
+    return tuple(map(int, port.split("/")))
 
 
 class NokiaOltDriver(NetworkDriver):
     """NAPALM Nokia OLT Handler."""
 
+    # compiled XPath queries used by get_facts, they return the first matching value as
+    # a plain string (no reference back to the parsed tree)
+    _XP_HOSTNAME = ET.XPath(
+        '(.//hierarchy[@name="isam"]//instance/*[@name="description"])[1]/text()',
+        smart_strings=False,
+    )
+    _XP_OS_VERSION = ET.XPath(
+        '(.//hierarchy[@name="ansi"]//instance/*[@name="isam-feature-group"])[1]/text()',
+        smart_strings=False,
+    )
+    _XP_SERIAL_NUMBER = ET.XPath(
+        '(.//hierarchy[@name="shelf"]//instance/*[@name="serial-no"])[1]/text()',
+        smart_strings=False,
+    )
+    _XP_VARIANT = ET.XPath(
+        '(.//hierarchy[@name="shelf"]//instance/*[@name="variant"])[1]/text()',
+        smart_strings=False,
+    )
+
     def __init__(self, hostname, username, password, timeout=60, optional_args=None):
         if optional_args is None:
             optional_args = {}
@@ -42,119 +108,266 @@ class NokiaOltDriver(NetworkDriver):
         self.global_delay_factor = optional_args.get("global_delay_factor", 1)
         self.port = optional_args.get("port", 22)
 
+        """Extra sessions used to send independent commands concurrently
+            - For example: optional_args={"session_pool_size": 4}
+        """
+        self.session_pool_size = optional_args.get("session_pool_size", 0)
+
+        """Write independent commands in one go on the main session instead of one by one
+            - For example: optional_args={"pipeline_commands": True}
+        """
+        self.pipeline_commands = optional_args.get("pipeline_commands", False)
+
+        """Seconds the table getters reuse a parsed output, disabled (0) by default
+            - For example: optional_args={"cache_ttl": 5}
+        """
+        self.cache_ttl = optional_args.get("cache_ttl", 0)
+
         self.device = None
+        self._channel_pool = []
+        self._model_cache = None
+        self._serial_number_cache = None
+        self._query_cache = {}
+        self._port_cache = None
+        self._last_keepalive = None
         self.config_replace = False
         self.interface_map = {}
         self.profile = ["sros_isam"]
 
-    def _send_command(self, command, xml_format=False):
+    def _send_command(self, command, xml_format=False, device=None):
         """Send command to device"""
+        if device is None:
+            device = self.device
         if xml_format:
             command += " xml"
-        output = self.device.send_command(command, expect_string=r"#$")
+        output = device.send_command(command, expect_string=r"#$")
         return output
 
-    def open(self):
-        """Open an SSH tunnel connection to the device."""
+    def _send_commands(self, commands, xml_format=False):
+        """
+        Send several independent commands to device, returns the outputs keyed by command
+
+        The commands are spread over the session pool when one is opened, pipelined on
+        the main session when pipeline_commands is set (PIPELINE_MAX_COMMANDS at a time),
+        otherwise sent one by one.
+        """
+        if not self._channel_pool:
+            if self.pipeline_commands:
+                outputs = {}
+                for start in range(0, len(commands), PIPELINE_MAX_COMMANDS):
+                    batch = commands[start : start + PIPELINE_MAX_COMMANDS]
+                    outputs.update(self._send_pipelined(batch, xml_format=xml_format))
+                return outputs
+            return {
+                command: self._send_command(command, xml_format=xml_format)
+                for command in commands
+            }
+
+        sessions = queue.Queue()
+        for device in self._channel_pool:
+            sessions.put(device)
+
+        def send(command):
+            device = sessions.get()
+            try:
+                return self._send_command(command, xml_format=xml_format, device=device)
+            finally:
+                sessions.put(device)
+
+        with ThreadPoolExecutor(max_workers=len(self._channel_pool)) as executor:
+            return dict(zip(commands, executor.map(send, commands)))
+
+    def _send_pipelined(self, commands, xml_format=False):
+        """
+        Write all commands at once on the main session, returns the outputs keyed by command
+
+        The outputs are read back prompt by prompt, so the batch costs a single round-trip
+        instead of one per command. Each output must start with the echo of its own
+        command, if not the session is out of step (echoed typeahead, stray prompt): the
+        outputs still owed by the device are read and dropped, one prompt per command,
+        and the remaining commands are sent again one by one.
+        """
+        device = self.device
+        sent_commands = [f"{command} xml" if xml_format else command for command in commands]
+        device.write_channel("".join(device.normalize_cmd(cmd) for cmd in sent_commands))
+
+        prompt = re.escape(device.base_prompt) + r"[^\n]*#"
+        outputs = {}
+        for index, (command, sent_command) in enumerate(zip(commands, sent_commands)):
+            output = device.normalize_linefeeds(device.read_until_pattern(pattern=prompt))
+            echo, _, output = output.lstrip().partition("\n")
+            if echo.strip() != sent_command or output.split("\n", 1)[0].strip() in sent_commands:
+                # without its echo this read was not the command output (stray prompt), so
+                # the prompt of this command is still to come as well
+                pending = len(sent_commands) - index - (echo.strip() == sent_command)
+                for _ in range(pending):
+                    device.read_until_pattern(pattern=prompt)
+                for command in commands[index:]:
+                    outputs[command] = self._send_command(command, xml_format=xml_format)
+                return outputs
+            outputs[command] = device.strip_prompt(output)
+        return outputs
+
+    def _connect(self):
+        """Open a prepared netmiko session to the device."""
         device_type = "cisco_ios_ssh"
         if self.transport == "telnet":
             device_type = "cisco_ios_telnet"
-        self.device = ConnectHandler(
+        device = ConnectHandler(
             device_type=device_type,
             host=self.hostname,
             username=self.username,
             password=self.password,
             **self.netmiko_optional_args,
         )
-        self._prep_session()
+        self._prep_session(device)
+        return device
+
+    def open(self):
+        """Open an SSH tunnel connection to the device."""
+        self._query_cache = {}
+        self._port_cache = None
+        self._last_keepalive = None
+        self.device = self._connect()
+        self._channel_pool = [self._connect() for _ in range(self.session_pool_size)]
 
     def close(self):
         """Close the connection to the device."""
+        for device in self._channel_pool:
+            device.disconnect()
+        self._channel_pool = []
+        self._query_cache = {}
+        self._port_cache = None
         self.device.disconnect()
 
     def is_alive(self):
         """Returns a flag with the state of the connection."""
-        null = chr(0)
         if self.device is None:
             return {"is_alive": False}
         else:
-            # SSH
+            ssh = self.transport == "ssh"
+            if ssh:
+                # cheap local check first, no point writing to a transport that is already down
+                transport = getattr(self.device.remote_conn, "transport", None)
+                if transport is None or not transport.is_active():
+                    return {"is_alive": False}
             try:
-                # Try sending ASCII null byte to maintain the connection alive
-                self.device.write_channel(null)
-                return {"is_alive": self.device.remote_conn.transport.is_active()}
+                # Try sending ASCII null byte to maintain the connection alive,
+                # over SSH skipped when one was sent less than SSH_KEEPALIVE_INTERVAL ago
+                now = time.monotonic()
+                if (
+                    not ssh
+                    or self._last_keepalive is None
+                    or now - self._last_keepalive >= SSH_KEEPALIVE_INTERVAL
+                ):
+                    self.device.write_channel(SSH_KEEPALIVE)
+                    self._last_keepalive = now
+                if not ssh:
+                    # telnet has no transport to ask, the write above went through
+                    return {"is_alive": True}
+                return {"is_alive": transport.is_active()}
             except (socket.error, EOFError):
                 # If unable to send, we can tell for sure that the connection
                 # is unusable
                 return {"is_alive": False}
 
-    def _prep_session(self):
+    def _prep_session(self, device=None):
         cmds = [
             "environment mode batch inhibit-alarms",
             "exit all",
         ]
         for command in cmds:
-            self._send_command(command)
+            self._send_command(command, device=device)
 
     def convert_software_version_xml_to_dict(self, xml_data):
         """Convert software management version xml data to dict format"""
 
         if xml_data:
-            for line in xml_data.splitlines():
-                if "info" in line:
-                    line = line.replace(">", " ").replace("<", " ").replace("name=", "")
-                    line = line.split()
-                    software = f"{line[-2]}"
-                    return {"ISAM": software}
+            info = self._parse_xml(xml_data).find(".//info")
+            if info is not None:
+                return {"ISAM": info.text}
+
+    def _parse_xml(self, xml_data):
+        """Parse xml output of a command into an element tree"""
+        parser = ET.XMLParser(remove_comments=True)
+        return ET.parse(_TextReader(xml_data), parser).getroot()
+
+    def _iter_xml_instances(self, xml_data):
+        """Stream the instance elements of xml data, each one is freed once handled"""
+        for _, instance_elem in ET.iterparse(
+            _TextReader(xml_data),
+            events=("end",),
+            tag="instance",
+            remove_comments=True,
+        ):
+            yield instance_elem
+            # drop parsed instances, only their data is kept
+            instance_elem.clear()
+            while instance_elem.getprevious() is not None:
+                del instance_elem.getparent()[0]
 
     def convert_xml_to_list(self, xml_data):
         """Convert xml data to list format"""
         if xml_data:
-            root = """"""
-            for line in xml_data.splitlines():
-                if "hierarchy" in line:
-                    continue
-                root += line
-            root = ET.fromstring(root.strip())
-
-            instances = []
-            for instance_elem in root.findall("instance"):
-                data = {}
-                for element in instance_elem:
-                    name = element.attrib["name"]
-                    value = element.text
-                    data[name] = value
-                instances.append(data)
-            return instances
+            return [
+                {element.get("name"): element.text for element in instance_elem}
+                for instance_elem in self._iter_xml_instances(xml_data)
+            ]
         else:
             return
 
+    def convert_xml_to_value_list(self, xml_data, name):
+        """Convert xml data to the list of values of the given field"""
+        values = []
+        for instance_elem in self._iter_xml_instances(xml_data):
+            value = self._get_xml_attr(instance_elem, name)
+            if value:
+                values.append(value)
+        return values
+
     def _convert_xml_elem_to_dict(self, elem=None):
-        """convert xml output to dict"""
-        data = {}
-        for e in elem.iter():
-            if "instance" == e.tag:
-                continue
-            key_name = e.attrib["name"].replace(" ", "_")
-            key_value = e.text
-            data[key_name] = key_value
-        return data
+        """convert xml output of an instance to dict"""
+        return {e.get("name").replace(" ", "_"): e.text for e in elem}
+
+    def _get_xml_attr(self, elem, name):
+        """get the value of a single field of an xml instance"""
+        return next((e.text for e in elem if e.get("name") == name), None)
 
     def _convert_list_to_dict(self, data, key):
         """
         Convert list of data to dict using given key
         """
-        data_dict = {}
-        for record in data:
-            try:
-                data_dict[record[key]] = record
-            except KeyError:
-                pass
-        return data_dict
+        return {record[key]: record for record in data if key in record}
+
+    def _query(self, command, key):
+        """
+        Send xml command to device and convert its instances to dict using given key
+
+        The result is kept for cache_ttl seconds so getters polled back to back do not
+        query the device again, callers get their own copy of it.
+        """
+        now = time.monotonic()
+        cached = self._query_cache.get(command)
+        if cached and cached[0] > now:
+            return {k: dict(record) for k, record in cached[1].items()}
+
+        data = self._send_command(command, xml_format=True)
+        if data:
+            data_list = self.convert_xml_to_list(data)
+            result = self._convert_list_to_dict(data_list, key)
+            if self.cache_ttl > 0:
+                self._query_cache[command] = (now + self.cache_ttl, result)
+                return {k: dict(record) for k, record in result.items()}
+            return result
+        else:
+            return f"No available ** {command} ** data from the {self.hostname}"
 
     def cli(self, commands):
         """A generic function that allows the client to send any command to the remote device"""
 
+        # the commands may change what the cached tables and ports hold
+        self._query_cache = {}
+        self._port_cache = None
         output = {}
         try:
             for cmd in commands:
@@ -166,6 +379,9 @@ class NokiaOltDriver(NetworkDriver):
     def send_single_command(self, cmd):
         """A generic function that allows the client to send any command to the remote device"""
 
+        # the command may change what the cached tables and ports hold
+        self._query_cache = {}
+        self._port_cache = None
         output = self._send_command(cmd)
         return output
 
@@ -178,14 +394,10 @@ class NokiaOltDriver(NetworkDriver):
             command = "info configure"
             output_ = self._send_command(command)
             if output_:
-                configs["running"] = output_
-                data = str(configs["running"]).split("\n")
-                non_empty_lines = [line for line in data if line.strip() != ""]
-
-                string_without_empty_lines = ""
-                for line in non_empty_lines:
-                    string_without_empty_lines += line + "\n"
-                configs["running"] = string_without_empty_lines
+                # drop empty lines
+                configs["running"] = (
+                    "\n".join(line for line in output_.splitlines() if line.strip()) + "\n"
+                )
         if retrieve.lower() in ("startup", "all"):
             pass
         return configs
@@ -194,12 +406,13 @@ class NokiaOltDriver(NetworkDriver):
         """get device model, by parsing the "admin display-config' cmd output"""
 
         if data:
-            lines = data.splitlines()
-            for line in lines:
-                if "Copyright" in line and "NOKIA" in line:
-                    line_list = line.split()
-                    nokia_index = line_list.index("NOKIA")
-                    return f"{line_list[nokia_index + 1]} {line_list[nokia_index + 2]}"
+            line = next(
+                (l for l in data.splitlines() if "Copyright" in l and "NOKIA" in l), None
+            )
+            if line:
+                line_list = line.split()
+                nokia_index = line_list.index("NOKIA")
+                return f"{line_list[nokia_index + 1]} {line_list[nokia_index + 2]}"
 
     def get_facts(self):
         """Returns facts for device"""
@@ -210,52 +423,66 @@ class NokiaOltDriver(NetworkDriver):
         sn_command = "show equipment shelf 1/1 detail"
         port_command = "show equipment ont interface"
 
-        hostname_output = self._send_command(hostname_command, xml_format=True)
-        os_output = self._send_command(os_command, xml_format=True)
-        uptime_output = self._send_command(uptime_command)
-        sn_output = self._send_command(sn_command, xml_format=True)
-        port_output = self._send_command(port_command, xml_format=True)
-        model_output = self._send_command(model_command, xml_format=False)
-        device_model = self.make_device_model(model_output)
-
-        hostname_xml_tree = ET.fromstring(hostname_output)
-        os_xml_tree = ET.fromstring(os_output)
-        sn_xml_tree = ET.fromstring(sn_output)
-        port_xml_tree = ET.fromstring(port_output)
-
+        # model and serial number do not change, only fetch them once per driver
+        xml_commands = [hostname_command, os_command, port_command]
+        commands = [uptime_command]
+        if self._model_cache is None:
+            xml_commands.append(sn_command)
+            commands.append(model_command)
+
+        xml_outputs = self._send_commands(xml_commands, xml_format=True)
+
+        # parse the xml outputs while the remaining commands are sent
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # the ont list can be large, stream it instead of building its tree
+            port_list = executor.submit(
+                self.convert_xml_to_value_list, xml_outputs.pop(port_command), "ont-idx"
+            )
+            xml_trees = {
+                command: executor.submit(self._parse_xml, xml_outputs.pop(command))
+                for command in xml_commands
+                if command != port_command
+            }
+            outputs = self._send_commands(commands)
+            xml_trees = {command: tree.result() for command, tree in xml_trees.items()}
+            port_list = port_list.result()
+        uptime_output = outputs[uptime_command]
+
+        hostname_xml_tree = xml_trees[hostname_command]
+        os_xml_tree = xml_trees[os_command]
+
+        if self._model_cache is None:
+            device_model = self.make_device_model(outputs[model_command])
+            sn_xml_tree = xml_trees[sn_command]
+
+            # get serial_number and model
+            serial_number = self._XP_SERIAL_NUMBER(sn_xml_tree)
+            variant = self._XP_VARIANT(sn_xml_tree)
+            if variant:
+                device_model += f" ({variant[0]})"
+            self._model_cache = device_model
+            self._serial_number_cache = serial_number[0] if serial_number else ""
+
+        # create default dict
         facts = {}
-        facts["model"] = device_model
-        port_list = []
-
-        # create default dict and get hostname
-        for elem in hostname_xml_tree.findall('.//hierarchy[@name="isam"]'):
-            dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            if "description" in dummy_data:
-                hostname = dummy_data["description"]
-                facts["hostname"] = hostname
-                facts["vendor"] = "Nokia"
-                facts["uptime"] = ""
-                facts["os_version"] = ""
-                facts["serial_number"] = ""
-                facts["fqdn"] = "Unknown"
-                facts["interface_list"] = []
+        facts["model"] = self._model_cache
+        facts["hostname"] = ""
+        facts["vendor"] = "Nokia"
+        facts["uptime"] = ""
+        facts["os_version"] = ""
+        facts["serial_number"] = self._serial_number_cache
+        facts["fqdn"] = "Unknown"
+        facts["interface_list"] = []
+
+        # get hostname
+        hostname = self._XP_HOSTNAME(hostname_xml_tree)
+        if hostname:
+            facts["hostname"] = hostname[0]
 
         # get os_version
-        for elem in os_xml_tree.findall('.//hierarchy[@name="ansi"]'):
-            dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            if "isam-feature-group" in dummy_data:
-                os_version = dummy_data["isam-feature-group"]
-                facts["os_version"] = os_version
-
-        # get serial_number and model
-        for elem in sn_xml_tree.findall('.//hierarchy[@name="shelf"]'):
-            dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            if "serial-no" in dummy_data:
-                serial_number = dummy_data["serial-no"]
-                facts["serial_number"] = serial_number
-            if "variant" in dummy_data:
-                variant = dummy_data["variant"]
-                facts["model"] += f" ({variant})"
+        os_version = self._XP_OS_VERSION(os_xml_tree)
+        if os_version:
+            facts["os_version"] = os_version[0]
 
         # get uptime
         for line in uptime_output.splitlines():
@@ -265,16 +492,11 @@ class NokiaOltDriver(NetworkDriver):
                 continue
             if "System" in split_line[0]:
                 if "Up" in split_line[1]:
-                    for r in range(4):
-                        split_line.pop(0)
-                    uptime = " ".join(split_line)
-                    facts["uptime"] = uptime
+                    # drop the "System Up Time :" label
+                    facts["uptime"] = " ".join(split_line[4:])
+                    break
         # get interface_list
-        for elem in port_xml_tree.findall(".//instance"):
-            dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            if "ont-idx" in dummy_data:
-                port_list.append(dummy_data["ont-idx"])
-        port_list.sort(key=lambda p: list(map(int, p.split("/"))))
+        port_list.sort(key=_port_key)
         facts["interface_list"] = port_list
         return facts
 
@@ -283,27 +505,26 @@ class NokiaOltDriver(NetworkDriver):
         vlan_name_command = "show vlan name"
         tagging_command = "show vlan residential-bridge extensive"
 
-        vlan_name_output = self._send_command(vlan_name_command, xml_format=True)
-        tagging_output = self._send_command(tagging_command, xml_format=True)
+        outputs = self._send_commands(
+            [vlan_name_command, tagging_command], xml_format=True
+        )
 
-        output_xml_tree = ET.fromstring(vlan_name_output)
-        tag_xml_tree = ET.fromstring(tagging_output)
+        output_xml_tree = self._parse_xml(outputs.pop(vlan_name_command))
+        tag_xml_tree = self._parse_xml(outputs.pop(tagging_command))
 
         vlans = {}
         # create default dict and get vlan_id and name
-        for elem in output_xml_tree.findall(".//instance"):
-            dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            primary_key = int(dummy_data["id"])
+        for elem in output_xml_tree.iter("instance"):
+            primary_key = int(elem.findtext('*[@name="id"]'))
             if primary_key not in vlans:
                 vlans[primary_key] = {}
-                vlans[primary_key]["name"] = dummy_data["name"]
+                vlans[primary_key]["name"] = elem.findtext('*[@name="name"]')
                 vlans[primary_key]["interfaces"] = []
 
         # get tagged/untagged ports
-        for elem in tag_xml_tree.findall(".//instance"):
-            dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            vlan_id = int(dummy_data["vlan-id"])
-            port_raw = dummy_data["vlan-port"]
+        for elem in tag_xml_tree.iter("instance"):
+            vlan_id = int(elem.findtext('*[@name="vlan-id"]'))
+            port_raw = elem.findtext('*[@name="vlan-port"]')
             port = port_raw.split(":")[1]
             vlans[vlan_id]["interfaces"].append(port)
 
@@ -445,94 +666,39 @@ class NokiaOltDriver(NetworkDriver):
 
     def get_equipment_slot(self):
         """Returns equipments slot info"""
-        command = "show equipment slot"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "slot")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment slot", "slot")
 
     def get_equipment_slot_detail(self):
         """Returns slot details info"""
-        command = "show equipment slot detail"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "slot")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment slot detail", "slot")
 
     def get_equipment_ont_slot(self):
         """Returns ont slot info"""
-        command = "show equipment ont slot"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "ont-slot-idx")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment ont slot", "ont-slot-idx")
 
     def get_equipment_ont_optics(self):
         """Returns ont optics info"""
-        command = "show equipment ont optics"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "ont-idx")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment ont optics", "ont-idx")
 
     def get_pon_optics(self):
         """Returns pon optic info"""
-        command = "show pon optics"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "pon-idx")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show pon optics", "pon-idx")
 
     def get_equipment_ont_sw_downloads(self):
         """Returns software download info"""
-        command = "show equipment ont sw-download"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            if data:
-                data_list = self.convert_xml_to_list(data)
-                return self._convert_list_to_dict(data_list, "ont-idx")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment ont sw-download", "ont-idx")
 
     def get_vlan_fdb_board(self):
         """Returns VLAN info"""
-        command = "show vlan fdb-board"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "mac")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show vlan fdb-board", "mac")
 
     def get_ethernet_ont_operational_data(self):
         """Returns ethernet - ont operational info"""
-        command = "show ethernet ont operational-data"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "uni-idx")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show ethernet ont operational-data", "uni-idx")
 
     def get_equipment_ont_sw_version(self):
         """Returns ont software versions"""
-        command = "show equipment ont sw-version"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "sw-ver-id")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment ont sw-version", "sw-ver-id")
 
     def get_software_mgmt_version_etsi(self):
         """Returns software version for management"""
@@ -545,83 +711,55 @@ class NokiaOltDriver(NetworkDriver):
 
     def get_equipment_transceiver_inventor(self):
         """Returns transceiver inventory info"""
-        command = "show equipment transceiver-inventor"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "index")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment transceiver-inventor", "index")
 
     def get_equipment_diagnostics_sfp(self):
         """Returns Equipment diagnostic info"""
-        command = "show equipment diagnostics sfp"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "position")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment diagnostics sfp", "position")
 
     def get_vlan_name(self):
         """Returns VLANs info"""
-        command = "show vlan name"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "id")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show vlan name", "id")
 
     def get_vlan_bridge_port_fdb(self):
         """Returns VLANs info details"""
         command = "show vlan bridge-port-fdb"
         data = self._send_command(command, xml_format=True)
         if data:
-            tmp_data = self.convert_xml_to_list(data)
-            loaded_data = tmp_data
+            loaded_data = self.convert_xml_to_list(data)
             new_dict = {}
+            seen_macs = defaultdict(set)
 
             for entry in loaded_data:
                 port_ = entry["port"]
                 vlan_id_ = entry["vlan-id"]
                 mac_ = entry["mac"]
 
-                if port_ in new_dict.keys():
-                    tmp_data = new_dict[port_]
-                    for i in tmp_data:
-                        m = i[1]
-                        if m != mac_:
-                            new_dict[port_] += [(vlan_id_, mac_)]
-                            break
-                if port_ not in new_dict.keys():
-                    new_dict[port_] = [(vlan_id_, mac_)]
+                # keep the first (vlan, mac) seen for each mac of the port
+                if mac_ not in seen_macs[port_]:
+                    seen_macs[port_].add(mac_)
+                    new_dict.setdefault(port_, []).append((vlan_id_, mac_))
             return new_dict
         else:
             return f"No available ** {command} ** data from the {self.hostname}"
 
     def get_equipment_temperature(self):
         """Returns Equipment temperature"""
-        command = "show equipment temperature"
-        data = self._send_command(command, xml_format=True)
-        if data:
-            data_list = self.convert_xml_to_list(data)
-            return self._convert_list_to_dict(data_list, "sensor-id")
-        else:
-            return f"No available ** {command} ** data from the {self.hostname}"
+        return self._query("show equipment temperature", "sensor-id")
 
     def get_ntp_servers(self):
         """Returns IPV6 NTP servers."""
         command = "show sntp server-tablev6 "
         data = self._send_command(command, xml_format=True)
-        data = self.convert_xml_to_list(data)
+        if not data:
+            return {}
 
-        ntp_servers = defaultdict(list)
-        for sub in data:
-            for key in sub:
-                if key == "server-ip-addrv6":
-                    ntp_servers[key].append(sub[key])
-        return dict(ntp_servers)
+        xml_tree = self._parse_xml(data)
+        servers = [
+            elem.text
+            for elem in xml_tree.iterfind('.//instance/*[@name="server-ip-addrv6"]')
+        ]
+        return {"server-ip-addrv6": servers} if servers else {}
 
     def get_interfaces(self):
         """
@@ -646,19 +784,17 @@ class NokiaOltDriver(NetworkDriver):
         interface_dict = self.get_interfaces_ont()
         command = "show interface port"
         output = self._send_command(command, xml_format=True)
-        xml_tree = ET.fromstring(output)
-        for elem in xml_tree.findall(".//instance"):
+        xml_tree = self._parse_xml(output)
+        for elem in xml_tree.iter("instance"):
             dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            is_enabled = bool("up" in dummy_data.get("admin-status", ""))
-            is_up = bool("up" in dummy_data.get("oper-status", ""))
+            is_enabled = "up" in dummy_data.get("admin-status", "")
+            is_up = "up" in dummy_data.get("oper-status", "")
             if not interface_dict.get(dummy_data["port"]):
                 interface_dict[dummy_data["port"]] = {
                     "is_enabled": is_enabled,
                     "is_up": is_up,
                     "description": dummy_data.get("desc1", ""),
-                    "mac_address": "0000.0000.0000",
-                    "last_flapped": -1.0,
-                    "mtu": 0,
+                    **INTERFACE_DEFAULTS,
                     "speed": 1000,
                 }
         return interface_dict
@@ -685,71 +821,84 @@ class NokiaOltDriver(NetworkDriver):
         """
         pon_command = "show equipment ont status pon"
         xpon_command = "show equipment ont status x-pon"
-        pon_output = self._send_command(pon_command, xml_format=True)
-        xpon_output = self._send_command(xpon_command, xml_format=True)
-        pon_xml_tree = ET.fromstring(pon_output)
-        xpon_xml_tree = ET.fromstring(xpon_output)
+        outputs = self._send_commands([pon_command, xpon_command], xml_format=True)
+        pon_xml_tree = self._parse_xml(outputs.pop(pon_command))
+        xpon_xml_tree = self._parse_xml(outputs.pop(xpon_command))
+
+        # parse 1GE ports (PON) and 10GE ports (X-PON)
+        to_dict = self._convert_xml_elem_to_dict
+        instances = itertools.chain(
+            zip(map(to_dict, pon_xml_tree.iter("instance")), itertools.repeat(1000)),
+            zip(map(to_dict, xpon_xml_tree.iter("instance")), itertools.repeat(10000)),
+        )
+        interface_dict = {
+            "ont:" + dummy_data["ont"]: {
+                "is_enabled": "up" in dummy_data.get("admin-status", ""),
+                "is_up": "up" in dummy_data.get("oper-status", ""),
+                "description": dummy_data.get("desc1", ""),
+                **INTERFACE_DEFAULTS,
+                "speed": speed,
+            }
+            for dummy_data, speed in instances
+            if "ont" in dummy_data
+        }
+        return interface_dict
 
-        interface_dict = {}
+    def _extract_field(self, data, label, multiline=False):
+        """
+        get the value of a "label : value" field of cli output
 
-        # parse 1GE ports
-        for elem in pon_xml_tree.findall(".//instance"):
-            dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            if "ont" in dummy_data:
-                is_enabled = bool("up" in dummy_data.get("admin-status", ""))
-                is_up = bool("up" in dummy_data.get("oper-status", ""))
-                interface_name = "ont:" + dummy_data["ont"]
-                interface_dict[interface_name] = {
-                    "is_enabled": is_enabled,
-                    "is_up": is_up,
-                    "description": dummy_data.get("desc1", ""),
-                    "mac_address": "0000.0000.0000",
-                    "last_flapped": -1.0,
-                    "mtu": 0,
-                    "speed": 1000,
-                }
+        A multiline value runs until the next blank line.
+        """
+        start = 0
+        while True:
+            index = data.find(label, start)
+            if index < 0:
+                return ""
+            start = index + len(label)
+            colon = data.find(":", start)
+            # the label must begin a line and only blanks may follow it up to the colon
+            if (
+                (index == 0 or data[index - 1] == "\n")
+                and colon >= 0
+                and not data[start:colon].strip()
+            ):
+                break
+        end = data.find("\n\n" if multiline else "\n", colon)
+        if end < 0:
+            end = len(data)
+        return data[colon + 1 : end].strip()
+
+    def _list_non_vport_ports(self):
+        """
+        Returns the ports of "show port" output, vports excluded
 
-        # parse 10GE ports (X-PON)
-        for elem in xpon_xml_tree.findall(".//instance"):
-            dummy_data = self._convert_xml_elem_to_dict(elem=elem)
-            if "ont" in dummy_data:
-                is_enabled = bool("up" in dummy_data.get("admin-status", ""))
-                is_up = bool("up" in dummy_data.get("oper-status", ""))
-                interface_name = "ont:" + dummy_data["ont"]
-                interface_dict[interface_name] = {
-                    "is_enabled": is_enabled,
-                    "is_up": is_up,
-                    "description": dummy_data.get("desc1", ""),
-                    "mac_address": "0000.0000.0000",
-                    "last_flapped": -1.0,
-                    "mtu": 0,
-                    "speed": 10000,
-                }
+        The ports are reused for cache_ttl seconds so both LLDP getters called back to
+        back send the command once.
+        """
+        now = time.monotonic()
+        if self._port_cache is not None and now - self._port_cache[0] < self.cache_ttl:
+            return self._port_cache[1]
 
-        return interface_dict
+        port_command = "show port"
+        port_data = self._send_command(port_command, xml_format=False)
+        ports = tuple(NON_VPORT_PORT_RE.findall(port_data))
+        self._port_cache = (now, ports)
+        return ports
 
     def get_lldp_neighbors(self):
         """Returns a dictionary with LLDP neighbors"""
-        port_command = "show port"
-        port_data = self._send_command(port_command, xml_format=False)
-        ports = []
+        ports = self._list_non_vport_ports()
         lldp = {}
-        all_ports = re.findall(PORT_REGEX, port_data, re.MULTILINE)
-        for line in all_ports:
-            line = line.split()
-            if len(line) > 0:
-                if not line[-1] == "vport":
-                    ports.append(line[0])
-        for port in ports:
-            lldp_command = f"show port {port} ethernet lldp remote-info"
-            lldp_data = self._send_command(lldp_command, xml_format=False)
-            remote_host = re.search(REMOTE_HOST_REGEX, lldp_data, re.MULTILINE)
+        lldp_commands = {port: f"show port {port} ethernet lldp remote-info" for port in ports}
+        lldp_outputs = self._send_commands(list(lldp_commands.values()))
+        for port, lldp_command in lldp_commands.items():
+            lldp_data = lldp_outputs[lldp_command]
+            remote_host = REMOTE_HOST_RE.search(lldp_data)
             if remote_host:
                 lldp[port] = [{"hostname": remote_host.group(1), "port": ""}]
                 try:
-                    remote_port_data = re.search(
-                        REMOTE_PORT_REGEX, lldp_data, re.MULTILINE
-                    )
+                    remote_port_data = REMOTE_PORT_RE.search(lldp_data)
                     remote_port = remote_port_data.group(1).split()[1]
                     lldp[port][0]["port"] = remote_port.replace('"', "")
                 except IndexError:
@@ -758,26 +907,19 @@ class NokiaOltDriver(NetworkDriver):
 
     def get_lldp_neighbors_detail(self):
         """Returns a detailed view of the LLDP neighbors as a dictionary"""
-        port_command = "show port"
-        port_data = self._send_command(port_command, xml_format=False)
-        ports = []
+        ports = self._list_non_vport_ports()
         lldp = {}
-        all_ports = re.findall(PORT_REGEX, port_data, re.MULTILINE)
-        for line in all_ports:
-            line = line.split()
-            if len(line) > 0:
-                if not line[-1] == "vport":
-                    ports.append(line[0])
-        for port in ports:
-            lldp_command = f"show port {port} ethernet lldp remote-info"
-            lldp_data = self._send_command(lldp_command, xml_format=False)
-            remote_host = re.findall(REMOTE_HOST_REGEX, lldp_data, re.MULTILINE)
-            if len(remote_host) > 0:
+        lldp_commands = {port: f"show port {port} ethernet lldp remote-info" for port in ports}
+        lldp_outputs = self._send_commands(list(lldp_commands.values()))
+        for port, lldp_command in lldp_commands.items():
+            lldp_data = lldp_outputs[lldp_command]
+            remote_host = REMOTE_HOST_RE.search(lldp_data)
+            if remote_host:
                 lldp[port] = [
                     {
                         "parent_interface": port,
                         "remote_chassis_id": "",
-                        "remote_system_name": remote_host[0],
+                        "remote_system_name": remote_host.group(1),
                         "remote_port": "",
                         "remote_port_description": "",
                         "remote_system_description": "",
@@ -785,39 +927,26 @@ class NokiaOltDriver(NetworkDriver):
                         "remote_system_enable_capab": "",
                     }
                 ]
-                remote_chassis_id_data = re.search(
-                    REMOTE_CHASSIS_REGEX, lldp_data, re.MULTILINE
-                )
-                remote_port_descr_data = re.search(
-                    REMOTE_PORT_DESCR_REGEX, lldp_data, re.MULTILINE
+                lldp[port][0]["remote_chassis_id"] = self._extract_field(
+                    lldp_data, "Chassis Id"
                 )
-                remote_sys_descr_data = re.search(
-                    REMOTE_SYS_DESCR_REGEX, lldp_data, flags=re.S | re.M
+                lldp[port][0]["remote_port_description"] = self._extract_field(
+                    lldp_data, "Port Description"
                 )
-                remote_sys_cap_data = re.search(
-                    REMOTE_SYS_CAP_REGEX, lldp_data, re.MULTILINE
+                remote_sys_descr = self._extract_field(
+                    lldp_data, "System Description", multiline=True
                 )
-                remote_sys_en_cap_data = re.search(
-                    REMOTE_SYS_EN_CAP_REGEX, lldp_data, re.MULTILINE
+                lldp[port][0]["remote_system_description"] = " ".join(
+                    remote_sys_descr.split()
                 )
-                lldp[port][0]["remote_chassis_id"] = remote_chassis_id_data.group(1)
-                lldp[port][0]["remote_port_description"] = remote_port_descr_data.group(
-                    1
+                lldp[port][0]["remote_system_capab"] = self._extract_field(
+                    lldp_data, "Supported Caps"
                 )
-                lldp[port][0][
-                    "remote_system_description"
-                ] = remote_sys_descr_data.group(1)
-                lldp[port][0]["remote_system_description"] = " ".join(
-                    lldp[port][0]["remote_system_description"].split()
+                lldp[port][0]["remote_system_enable_capab"] = self._extract_field(
+                    lldp_data, "Enabled Caps"
                 )
-                lldp[port][0]["remote_system_capab"] = remote_sys_cap_data.group(1)
-                lldp[port][0][
-                    "remote_system_enable_capab"
-                ] = remote_sys_en_cap_data.group(1)
                 try:
-                    remote_port_data = re.search(
-                        REMOTE_PORT_REGEX, lldp_data, re.MULTILINE
-                    )
+                    remote_port_data = REMOTE_PORT_RE.search(lldp_data)
                     remote_port = remote_port_data.group(1).split()[1]
                     lldp[port][0]["remote_port"] = remote_port.replace('"', "")
                 except IndexError:
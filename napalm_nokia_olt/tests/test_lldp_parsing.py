@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""Parsing of the "show port" and LLDP remote-info cli outputs."""
+
+import re
+import unittest
+
+from napalm_nokia_olt.nokia_olt import (
+    NokiaOltDriver,
+    NON_VPORT_PORT_RE,
+    PORT_REGEX,
+    REMOTE_CHASSIS_REGEX,
+    REMOTE_PORT_DESCR_REGEX,
+    REMOTE_SYS_DESCR_REGEX,
+)
+
+
+SHOW_PORT = """
+===============================================================================
+Ports on Slot nt-a
+===============================================================================
+Port          Admin Link Port    Cfg  Oper LAG/ Port Port Port   C/QS/S/XFP/
+Id            State      State   MTU  MTU  Bndl Mode Encp Type   MDIMDX
+-------------------------------------------------------------------------------
+nt-a:xfp:1    Up    Yes  Up      9212 9212    - netw null xcme   10GBASE-LR
+nt-a:xfp:2    Up    No   Down    9212 9212    - netw null xcme
+nt-a:xfp:3    Down  No   Down    9212 9212    - netw null xcme
+lt:1/1/1:vp   Up    Yes  Up      9212 9212    - netw null vport
+lt:1/1/2:vp   Up    Yes  Up      9212 9212    - netw null vport
+===============================================================================
+"""
+
+LLDP_REMOTE_INFO = """
+===============================================================================
+Remote Peer Information
+===============================================================================
+Remote Peer Index 1 at timestamp 04/15/2024 10:22:31:
+Supported Caps       : bridge router
+Enabled Caps         : router
+Chassis Id Subtype   : 4 (macAddress)
+Chassis Id           : 00:11:22:33:44:55
+PortId Subtype       : 5 (interfaceName)
+Port Id              : 31:2F:31:2F:31
+                       "1/1/1"
+Port Description     : to-olt-1
+System Name          : core-rtr-1
+System Description   : Nokia 7750 SR
+                       TiMOS-C-20.10.R1
+
+
+Remote Peer Index 1 management addresses:
+===============================================================================
+"""
+
+# empty port description and a system description followed by a single blank line
+LLDP_REMOTE_INFO_SHORT = """
+Supported Caps       : bridge
+Enabled Caps         : bridge
+Chassis Id           : 00:aa:bb:cc:dd:ee
+Port Id              : 65:74:68:30
+                       "eth0"
+Port Description     :
+System Name          : access-sw-7
+System Description   : Linux access-sw-7
+
+Remote Peer Index 2 management addresses:
+"""
+
+NO_LLDP_REMOTE_INFO = """
+===============================================================================
+Remote Peer Information
+===============================================================================
+No remote peers found
+"""
+
+
+def baseline_non_vport_ports(port_data):
+    """ports selected by the driver before NON_VPORT_PORT_REGEX was introduced"""
+    ports = []
+    for line in re.findall(PORT_REGEX, port_data, re.MULTILINE):
+        line = line.split()
+        if len(line) > 0:
+            if not line[-1] == "vport":
+                ports.append(line[0])
+    return ports
+
+
+class TestNonVportPorts(unittest.TestCase):
+    def test_vports_and_table_lines_are_skipped(self):
+        self.assertEqual(
+            NON_VPORT_PORT_RE.findall(SHOW_PORT), ["nt-a:xfp:1", "nt-a:xfp:2", "nt-a:xfp:3"]
+        )
+
+    def test_vport_with_trailing_blanks(self):
+        line = "lt:1/1/3:vp   Up    Yes  Up      9212 9212    - netw null vport  \t\n"
+        self.assertEqual(NON_VPORT_PORT_RE.findall(line), [])
+        self.assertEqual(baseline_non_vport_ports(line), [])
+
+    def test_same_ports_as_baseline(self):
+        self.assertEqual(NON_VPORT_PORT_RE.findall(SHOW_PORT), baseline_non_vport_ports(SHOW_PORT))
+
+    def test_list_non_vport_ports(self):
+        driver = NokiaOltDriver("olt", "user", "password")
+        driver._send_command = lambda command, xml_format=False: SHOW_PORT
+        self.assertEqual(driver._list_non_vport_ports(), ("nt-a:xfp:1", "nt-a:xfp:2", "nt-a:xfp:3"))
+
+
+class TestExtractField(unittest.TestCase):
+    def setUp(self):
+        self.driver = NokiaOltDriver("olt", "user", "password")
+
+    def test_single_line_fields(self):
+        extract = self.driver._extract_field
+        self.assertEqual(extract(LLDP_REMOTE_INFO, "Chassis Id"), "00:11:22:33:44:55")
+        self.assertEqual(extract(LLDP_REMOTE_INFO, "Port Description"), "to-olt-1")
+        self.assertEqual(extract(LLDP_REMOTE_INFO, "Supported Caps"), "bridge router")
+        self.assertEqual(extract(LLDP_REMOTE_INFO, "Enabled Caps"), "router")
+
+    def test_multiline_field(self):
+        self.assertEqual(
+            self.driver._extract_field(LLDP_REMOTE_INFO, "System Description", multiline=True),
+            "Nokia 7750 SR\n                       TiMOS-C-20.10.R1",
+        )
+
+    def test_label_must_be_followed_by_the_colon(self):
+        # "Chassis Id Subtype" comes first and must not be taken for "Chassis Id"
+        self.assertEqual(
+            self.driver._extract_field("Chassis Id Subtype   : 4 (macAddress)\n", "Chassis Id"), ""
+        )
+
+    def test_missing_field(self):
+        self.assertEqual(self.driver._extract_field(NO_LLDP_REMOTE_INFO, "Chassis Id"), "")
+
+    def test_same_values_as_baseline_patterns(self):
+        extract = self.driver._extract_field
+        self.assertEqual(
+            re.search(REMOTE_PORT_DESCR_REGEX, LLDP_REMOTE_INFO, re.MULTILINE).group(1),
+            extract(LLDP_REMOTE_INFO, "Port Description"),
+        )
+        self.assertEqual(
+            re.search(REMOTE_SYS_DESCR_REGEX, LLDP_REMOTE_INFO, re.S | re.M).group(1),
+            extract(LLDP_REMOTE_INFO, "System Description", multiline=True),
+        )
+
+    def test_differences_from_baseline_patterns(self):
+        extract = self.driver._extract_field
+        # the chassis id no longer keeps the blank that follows the colon
+        self.assertEqual(
+            re.search(REMOTE_CHASSIS_REGEX, LLDP_REMOTE_INFO, re.MULTILINE).group(1),
+            " 00:11:22:33:44:55",
+        )
+        # an empty port description no longer takes the next line
+        self.assertEqual(
+            re.search(REMOTE_PORT_DESCR_REGEX, LLDP_REMOTE_INFO_SHORT, re.MULTILINE).group(1),
+            "System Name          : access-sw-7",
+        )
+        self.assertEqual(extract(LLDP_REMOTE_INFO_SHORT, "Port Description"), "")
+        # the system description ends at the first blank line, the pattern needed two
+        self.assertIsNone(re.search(REMOTE_SYS_DESCR_REGEX, LLDP_REMOTE_INFO_SHORT, re.S | re.M))
+        self.assertEqual(
+            extract(LLDP_REMOTE_INFO_SHORT, "System Description", multiline=True),
+            "Linux access-sw-7",
+        )
+
+
+class TestLldpNeighbors(unittest.TestCase):
+    def setUp(self):
+        outputs = {
+            "show port": SHOW_PORT,
+            "show port nt-a:xfp:1 ethernet lldp remote-info": LLDP_REMOTE_INFO,
+            "show port nt-a:xfp:2 ethernet lldp remote-info": LLDP_REMOTE_INFO_SHORT,
+            "show port nt-a:xfp:3 ethernet lldp remote-info": NO_LLDP_REMOTE_INFO,
+        }
+        self.driver = NokiaOltDriver("olt", "user", "password")
+        self.driver._send_command = lambda command, xml_format=False: outputs[command]
+
+    def test_get_lldp_neighbors(self):
+        self.assertEqual(
+            self.driver.get_lldp_neighbors(),
+            {
+                "nt-a:xfp:1": [{"hostname": "core-rtr-1", "port": "1/1/1"}],
+                "nt-a:xfp:2": [{"hostname": "access-sw-7", "port": "eth0"}],
+            },
+        )
+
+    def test_get_lldp_neighbors_detail(self):
+        self.assertEqual(
+            self.driver.get_lldp_neighbors_detail(),
+            {
+                "nt-a:xfp:1": [
+                    {
+                        "parent_interface": "nt-a:xfp:1",
+                        "remote_chassis_id": "00:11:22:33:44:55",
+                        "remote_system_name": "core-rtr-1",
+                        "remote_port": "1/1/1",
+                        "remote_port_description": "to-olt-1",
+                        "remote_system_description": "Nokia 7750 SR TiMOS-C-20.10.R1",
+                        "remote_system_capab": "bridge router",
+                        "remote_system_enable_capab": "router",
+                    }
+                ],
+                "nt-a:xfp:2": [
+                    {
+                        "parent_interface": "nt-a:xfp:2",
+                        "remote_chassis_id": "00:aa:bb:cc:dd:ee",
+                        "remote_system_name": "access-sw-7",
+                        "remote_port": "eth0",
+                        "remote_port_description": "",
+                        "remote_system_description": "Linux access-sw-7",
+                        "remote_system_capab": "bridge",
+                        "remote_system_enable_capab": "bridge",
+                    }
+                ],
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()